@@ -18,7 +18,7 @@ def main():
     if 'model_selections' not in st.session_state:
         st.session_state.model_selections = []
     if 'combination_status' not in st.session_state:
-        st.session_state.combination_status = {}
+        st.session_state.combination_status = CombinationStatusStore()
     if 'universe' not in st.session_state:
         st.session_state.universe = []
     # Create main columns
@@ -228,32 +228,9 @@ def main():
         # Add cluster option
         run_on_cluster = st.checkbox("Summarize on cluster", value=False)
 
-        # Generate all combinations for status tracking
-        all_combinations = []
-        for config in st.session_state.model_selections:
-            impl = config['implementation']
-            for lev in config['leverages']:
-                if st.session_state.frontier_points:
-                    for point in st.session_state.frontier_points:
-                        combo_key = generate_combination_key(impl, lev, point)
-                        all_combinations.append({
-                            'key': combo_key,
-                            'impl': impl,
-                            'lev': lev,
-                            'frontier': point.get('key', ''),
-                            'status': st.session_state.combination_status.get(combo_key, 'pending')
-                        })
-                else:
-                    # Handle case with no frontier points
-                    combo_key = generate_combination_key(impl, lev, None)
-                    all_combinations.append({
-                        'key': combo_key,
-                        'impl': impl,
-                        'lev': lev,
-                        'frontier': None,
-                        'status': st.session_state.combination_status.get(combo_key, 'pending')
-                    })
-
+        # Index the combination space for status tracking
+        status_store = st.session_state.combination_status
+        status_store.sync(CombinationSpace(st.session_state.model_selections, st.session_state.frontier_points))
 
         # Collect all parameters
         parameters = {
@@ -287,40 +264,17 @@ def main():
                 st.write(f"Parameters saved to: {filepath}")
 
                 # Initialize/update status for all combinations
-                for combo in all_combinations:
-                    st.session_state.combination_status[combo['key']] = 'processing'
+                status_store.set_all('processing')
 
                 # Run summarization and get results
-                results = summarize_parameters(run_on_cluster, version)
+                results = summarize_parameters(status_store, run_on_cluster, version)
 
                 # Update status based on results
-                for combo_key, success in results.items():
-                    st.session_state.combination_status[combo_key] = "completed" if success else "failed"
+                status_store.apply_results(results)
 
         # Display status for all combinations
         st.subheader("Processing Status")
-
-        # Group combinations by implementation for cleaner display
-        current_impl = None
-        for combo in all_combinations:
-            if combo['impl'] != current_impl:
-                current_impl = combo['impl']
-                st.write(f"\n**{current_impl}**")
-
-            status = st.session_state.combination_status.get(combo['key'], 'pending')
-            status_colors = {
-                "pending": "🟧",
-                "processing": "🟧",
-                "completed": "🟩",
-                "failed": "🟥"
-            }
-
-            # Create status display string
-            display_text = f"{combo['lev']}"
-            if combo['frontier']:
-                display_text += f" - {combo['frontier']}"
-
-            st.write(f"{status_colors[status]} {display_text}: {status}")
+        display_combination_status(status_store)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,144 @@
+from array import array
+from constants import *
+
+PENDING = 0
+STATUS_CODES = {status: code for code, status in enumerate(COMBINATION_STATUSES)}
+
+
+class CombinationSpace:
+    """Index-addressable space of (implementation, leverage, frontier) combinations
+
+    Combination ``index`` maps to leverage pair ``index // n_frontiers`` and
+    frontier ``index % n_frontiers``, so nothing is materialized per combination.
+    """
+
+    def __init__(self, model_selections, frontier_points):
+        self.pairs = [(config['implementation'], lev)
+                      for config in model_selections
+                      for lev in config['leverages']]
+        self.frontiers = list(frontier_points) or [None]
+        self.frontier_keys = [point.get('key', '') if point else None for point in self.frontiers]
+        self.implementations = list(dict.fromkeys(impl for impl, _ in self.pairs))
+        self.signature = (tuple(self.pairs), tuple(self.frontier_keys))
+
+    def __len__(self):
+        return len(self.pairs) * len(self.frontiers)
+
+    def decode(self, index):
+        """Return (impl, lev, frontier point) for a combination index"""
+        pair_id, frontier_id = divmod(index, len(self.frontiers))
+        impl, lev = self.pairs[pair_id]
+        return impl, lev, self.frontiers[frontier_id]
+
+    def implementation(self, index):
+        """Return the implementation of a combination index"""
+        return self.pairs[index // len(self.frontiers)][0]
+
+    def key(self, index):
+        """Return the combination key string for a combination index"""
+        impl, lev, point = self.decode(index)
+        return generate_combination_key(impl, lev, point)
+
+
+def generate_combination_key(impl, lev, point):
+    """Generate a unique key for each combination"""
+    if point and point.get("key"):
+        return f"{impl}_{lev}_{point['key']}"
+    return f"{impl}_{lev}"
+
+
+class CombinationStatusStore:
+    """Per-combination statuses kept as a uint8 array with running aggregate counts"""
+
+    def __init__(self):
+        self.space = CombinationSpace([], [])
+        self.statuses = array('B')
+        self.impl_counts = {}
+
+    def __len__(self):
+        return len(self.statuses)
+
+    def sync(self, space):
+        """Point the store at a combination space, carrying over statuses of surviving combinations"""
+        if space.signature == self.space.signature:
+            return
+
+        old_space, old_statuses = self.space, self.statuses
+        self.space = space
+        self.statuses = array('B', bytes(len(space)))
+        self.impl_counts = {impl: [0] * len(COMBINATION_STATUSES) for impl in space.implementations}
+        for impl, _ in space.pairs:
+            self.impl_counts[impl][PENDING] += len(space.frontiers)
+
+        # Remap by (pair, frontier key) so a rerun with an edited selection keeps earlier results
+        old_pair_ids = {pair: i for i, pair in enumerate(old_space.pairs)}
+        old_frontier_ids = {key: i for i, key in enumerate(old_space.frontier_keys)}
+        frontier_map = [(i, old_frontier_ids[key]) for i, key in enumerate(space.frontier_keys)
+                        if key in old_frontier_ids]
+        old_n_frontiers = len(old_space.frontiers)
+        for pair_id, pair in enumerate(space.pairs):
+            old_pair_id = old_pair_ids.get(pair)
+            if old_pair_id is None:
+                continue
+            for frontier_id, old_frontier_id in frontier_map:
+                code = old_statuses[old_pair_id * old_n_frontiers + old_frontier_id]
+                if code != PENDING:
+                    self._set_code(pair_id * len(space.frontiers) + frontier_id, code)
+
+    def _set_code(self, index, code):
+        old_code = self.statuses[index]
+        if old_code == code:
+            return
+        counts = self.impl_counts[self.space.implementation(index)]
+        counts[old_code] -= 1
+        counts[code] += 1
+        self.statuses[index] = code
+
+    def get(self, index):
+        """Return the status name of a combination index"""
+        return COMBINATION_STATUSES[self.statuses[index]]
+
+    def set(self, index, status):
+        """Set the status name of a combination index"""
+        self._set_code(index, STATUS_CODES[status])
+
+    def set_all(self, status):
+        """Set every combination to the same status"""
+        code = STATUS_CODES[status]
+        self.statuses = array('B', bytes([code]) * len(self.statuses))
+        for counts in self.impl_counts.values():
+            total = sum(counts)
+            counts[:] = [0] * len(COMBINATION_STATUSES)
+            counts[code] = total
+
+    def apply_results(self, results):
+        """Mark each combination completed or failed from index-aligned success flags"""
+        for index, success in enumerate(results):
+            self.set(index, "completed" if success else "failed")
+
+    def status_counts(self):
+        """Return {status: count} across all combinations"""
+        totals = [sum(column) for column in zip(*self.impl_counts.values())] or [0] * len(COMBINATION_STATUSES)
+        return dict(zip(COMBINATION_STATUSES, totals))
+
+    def implementation_counts(self, impl):
+        """Return {status: count} for a single implementation"""
+        return dict(zip(COMBINATION_STATUSES, self.impl_counts.get(impl, [0] * len(COMBINATION_STATUSES))))
+
+    def count(self, statuses=None, impl=None):
+        """Count combinations matching the given statuses and implementation from the aggregates"""
+        codes = [STATUS_CODES[s] for s in statuses] if statuses else range(len(COMBINATION_STATUSES))
+        rows = [self.impl_counts.get(impl, [])] if impl else self.impl_counts.values()
+        return sum(row[code] for row in rows if row for code in codes)
+
+    def iter_indices(self, statuses=None, impl=None):
+        """Yield combination indices matching the given statuses and implementation"""
+        codes = {STATUS_CODES[s] for s in statuses} if statuses else None
+        n_frontiers = len(self.space.frontiers)
+        for pair_id, (pair_impl, _) in enumerate(self.space.pairs):
+            if impl and pair_impl != impl:
+                continue
+            start = pair_id * n_frontiers
+            for index in range(start, start + n_frontiers):
+                if codes is None or self.statuses[index] in codes:
+                    yield index
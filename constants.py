@@ -6,3 +6,14 @@ MODEL_IMPLEMENTATIONS = ["RC", "LS", "BLS", "CLS"]
 MODEL_LEVERAGES = ["EDI", "AE", "AEP", "AEPP", "AEPPP"]
 DEFAULT_FEES = {"EDI": -0.0035, "AE": -0.01, "AEP": -0.015, "AEPP": -0.02, "AEPPP": -0.025}
 SUMMARIZER_CONFIG_ARCHIVE = r"archived_summarizers/"
+
+# Combination status codes are the index into this tuple (stored as uint8)
+COMBINATION_STATUSES = ("pending", "processing", "completed", "failed")
+STATUS_COLORS = {"pending": "🟧", "processing": "🟧", "completed": "🟩", "failed": "🟥"}
+STATUS_PAGE_SIZE = 50
+
+# Job status database retention
+JOB_STATUS_DB = "job_status.db"
+JOB_ARCHIVE_DIR = r"job_archive/"
+JOB_RETENTION_DAYS = 30
+JOB_MAINTENANCE_INTERVAL = 24 * 60 * 60  # seconds between archive/vacuum passes
@@ -1,9 +1,10 @@
 import streamlit as st
 import pickle
 import os
-from itertools import product
+from itertools import product, islice
 import time
 from constants import *
+from combination_status import *
 import json
 import random
 
@@ -42,26 +43,16 @@ def save_parameters(params, db_table, environment):
     return os.path.abspath(filename)
 
 
-def summarize_parameters(run_on_cluster=False, version="2024"):
+def summarize_parameters(status_store, run_on_cluster=False, version="2024"):
     """Simulate parameter summarization with individual combination results"""
     # In practice, this would communicate with your actual summarization system
     # Here we'll simulate async completion of different combinations
     time.sleep(2)  # Simulate initial processing
 
-    # Return a dictionary of results for each combination
+    # Return a success flag for each combination, aligned with the store's combination indices
     # In practice, this would be populated by your actual system
-    results = {}
-    for key in st.session_state.combination_status:
-        # Simulate some failures for demonstration
-        results[key] = random.choice([True, True, True, False])
-
-    return results
-
-def generate_combination_key(impl, lev, point):
-    """Generate a unique key for each combination"""
-    if point and point.get("key"):
-        return f"{impl}_{lev}_{point['key']}"
-    return f"{impl}_{lev}"
+    # Simulate some failures for demonstration
+    return [random.choice([True, True, True, False]) for _ in range(len(status_store))]
 
 def generate_example_strings(template, universes, years, model_keys, frontier_points):
     """Generate example strings for each configuration"""
@@ -160,4 +151,45 @@ def display_summary_sidebar():
                              sum(len(config['leverages']) for config in st.session_state.get("model_selections", [])) * \
                              sum(len(point['points']) for point in st.session_state.get("frontier_points", []))
 
-        st.metric("Total Combinations", total_combinations)
\ No newline at end of file
+        st.metric("Total Combinations", total_combinations)
+
+def display_combination_status(status_store):
+    """Display aggregate status counts and a paginated, filterable view of combinations"""
+    space = status_store.space
+
+    status_counts = status_store.status_counts()
+    metric_cols = st.columns(len(COMBINATION_STATUSES))
+    for col, status in zip(metric_cols, COMBINATION_STATUSES):
+        col.metric(f"{STATUS_COLORS[status]} {status}", status_counts[status])
+
+    for impl in space.implementations:
+        impl_counts = status_store.implementation_counts(impl)
+        st.write(f"**{impl}**: " + ", ".join(f"{STATUS_COLORS[s]} {impl_counts[s]}" for s in COMBINATION_STATUSES))
+
+    if not len(status_store):
+        return
+
+    filter_col1, filter_col2 = st.columns(2)
+    with filter_col1:
+        status_filter = st.multiselect("Status", options=COMBINATION_STATUSES, key="status_filter")
+    with filter_col2:
+        impl_filter = st.selectbox("Implementation", options=["All"] + space.implementations, key="status_impl_filter")
+    impl_filter = None if impl_filter == "All" else impl_filter
+
+    n_matching = status_store.count(status_filter, impl_filter)
+    n_pages = max(1, -(-n_matching // STATUS_PAGE_SIZE))
+    page = st.number_input(f"Page (of {n_pages})", min_value=1, max_value=n_pages, value=1)
+
+    start = (page - 1) * STATUS_PAGE_SIZE
+    page_indices = islice(status_store.iter_indices(status_filter, impl_filter), start, start + STATUS_PAGE_SIZE)
+    lines = []
+    for index in page_indices:
+        impl, lev, point = space.decode(index)
+        status = status_store.get(index)
+
+        # Create status display string
+        display_text = f"{impl} {lev}"
+        if point:
+            display_text += f" - {point.get('key', '')}"
+        lines.append(f"{STATUS_COLORS[status]} {display_text}: {status}")
+    st.markdown("  \n".join(lines))
@@ -0,0 +1,180 @@
+import os
+import glob
+import json
+import zlib
+import sqlite3
+import logging
+from datetime import datetime, timedelta
+from constants import *
+
+FINISHED_STATUSES = ('COMPLETED', 'FAILED')
+JOB_COLUMNS = "job_id, config_file, status, start_time, end_time, combinations, results"
+
+
+def archive_partition_path(month, archive_dir=JOB_ARCHIVE_DIR):
+    """Path of the archive partition for a 'YYYY-MM' month"""
+    return os.path.join(archive_dir, f"jobs_{month.replace('-', '_')}.db")
+
+
+def _compress(value):
+    # JSON columns have NUMERIC affinity, so results like json.dumps(42) come back as int/float
+    if value is None:
+        return None
+    if not isinstance(value, bytes):
+        value = str(value).encode('utf-8')
+    return zlib.compress(value)
+
+
+def _decompress(value):
+    return zlib.decompress(value).decode('utf-8') if value is not None else None
+
+
+def archive_finished_jobs(db_path=JOB_STATUS_DB, archive_dir=JOB_ARCHIVE_DIR, retention_days=JOB_RETENTION_DAYS):
+    """Move finished jobs older than the retention window into compressed monthly partitions"""
+    cutoff = datetime.now() - timedelta(days=retention_days)
+    os.makedirs(archive_dir, exist_ok=True)
+    archived = 0
+
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.create_function('compress', 1, _compress, deterministic=True)
+        months = [row[0] for row in conn.execute(f'''
+            SELECT DISTINCT substr(end_time, 1, 7)
+            FROM jobs
+            WHERE status IN {FINISHED_STATUSES} AND end_time < ?
+        ''', (cutoff,))]
+
+        for month in months:
+            try:
+                conn.execute("ATTACH DATABASE ? AS archive", (archive_partition_path(month, archive_dir),))
+                try:
+                    # Copy and delete in one transaction so a job is never lost or duplicated
+                    with conn:
+                        conn.execute('''
+                            CREATE TABLE IF NOT EXISTS archive.jobs (
+                                job_id TEXT PRIMARY KEY,
+                                config_file TEXT,
+                                status TEXT,
+                                start_time TIMESTAMP,
+                                end_time TIMESTAMP,
+                                combinations BLOB,
+                                results BLOB
+                            )
+                        ''')
+                        selection = f'''
+                            FROM main.jobs
+                            WHERE status IN {FINISHED_STATUSES} AND end_time < ? AND substr(end_time, 1, 7) = ?
+                        '''
+                        conn.execute(f'''
+                            INSERT OR REPLACE INTO archive.jobs ({JOB_COLUMNS})
+                            SELECT job_id, config_file, status, start_time, end_time,
+                                   compress(combinations), compress(results)
+                            {selection}
+                        ''', (cutoff, month))
+                        archived += conn.execute(f"DELETE {selection}", (cutoff, month)).rowcount
+                finally:
+                    conn.execute("DETACH DATABASE archive")
+            except sqlite3.Error as e:
+                # One bad partition must not block the other months or the compaction that follows
+                logging.error(f"Error archiving jobs for {month}: {str(e)}")
+    finally:
+        conn.close()
+
+    logging.info(f"Archived {archived} jobs finished before {cutoff:%Y-%m-%d} into {len(months)} partitions")
+    return archived
+
+
+def compact_database(db_path=JOB_STATUS_DB):
+    """Reclaim space and refresh query planner statistics for the live database"""
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("VACUUM")
+        conn.execute("ANALYZE")
+    finally:
+        conn.close()
+
+
+def run_maintenance(db_path=JOB_STATUS_DB, archive_dir=JOB_ARCHIVE_DIR, retention_days=JOB_RETENTION_DAYS):
+    """Archive old finished jobs, then vacuum and analyze the live database"""
+    archived = archive_finished_jobs(db_path, archive_dir, retention_days)
+    compact_database(db_path)
+    return archived
+
+
+def _load_json(value):
+    # Numeric JSON comes back from the live table as int/float rather than text
+    if value is None or value == '':
+        return None
+    return json.loads(value if isinstance(value, (str, bytes)) else str(value))
+
+
+def _row_to_job(row, compressed=False):
+    job_id, config_file, status, start_time, end_time, combinations, results = row
+    if compressed:
+        combinations, results = _decompress(combinations), _decompress(results)
+    return {
+        'job_id': job_id,
+        'config_file': config_file,
+        'status': status,
+        'start_time': start_time,
+        'end_time': end_time,
+        'combinations': _load_json(combinations),
+        'results': _load_json(results)
+    }
+
+
+def _partition_paths(archive_dir=JOB_ARCHIVE_DIR, since=None, until=None):
+    """Archive partitions overlapping [since, until], newest first"""
+    paths = []
+    for path in glob.glob(os.path.join(archive_dir, "jobs_*.db")):
+        month = os.path.basename(path)[len("jobs_"):-len(".db")].replace('_', '-')
+        # str() covers both datetimes and the ISO strings start_time is stored as
+        if since and month < str(since)[:7]:
+            continue
+        if until and month > str(until)[:7]:
+            continue
+        paths.append(path)
+    return sorted(paths, reverse=True)
+
+
+def find_job(job_id, db_path=JOB_STATUS_DB, archive_dir=JOB_ARCHIVE_DIR, include_archive=True):
+    """Look up a job in the live database, falling back to the archive partitions"""
+    with sqlite3.connect(db_path) as conn:
+        row = conn.execute(f"SELECT {JOB_COLUMNS} FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+    if row:
+        return _row_to_job(row)
+    if not include_archive:
+        return None
+
+    for path in _partition_paths(archive_dir):
+        with sqlite3.connect(path) as conn:
+            row = conn.execute(f"SELECT {JOB_COLUMNS} FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        if row:
+            return _row_to_job(row, compressed=True)
+    return None
+
+
+def job_history(since=None, until=None, status=None, db_path=JOB_STATUS_DB, archive_dir=JOB_ARCHIVE_DIR):
+    """List jobs started within [since, until] across the live database and archive partitions, newest first"""
+    conditions, params = [], []
+    if since:
+        conditions.append("start_time >= ?")
+        params.append(since)
+    if until:
+        conditions.append("start_time <= ?")
+        params.append(until)
+    if status:
+        conditions.append("status = ?")
+        params.append(status)
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    query = f"SELECT {JOB_COLUMNS} FROM jobs {where}"
+
+    with sqlite3.connect(db_path) as conn:
+        jobs = [_row_to_job(row) for row in conn.execute(query, params)]
+
+    # Partitions are keyed by end month, which is never earlier than the start month
+    for path in _partition_paths(archive_dir, since=since):
+        with sqlite3.connect(path) as conn:
+            jobs.extend(_row_to_job(row, compressed=True) for row in conn.execute(query, params))
+
+    return sorted(jobs, key=lambda job: job['start_time'] or '', reverse=True)
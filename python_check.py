@@ -6,6 +6,8 @@ from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 import sqlite3
 from datetime import datetime
+from job_archive import run_maintenance
+from constants import JOB_STATUS_DB, JOB_MAINTENANCE_INTERVAL
 
 
 class ConfigHandler(FileSystemEventHandler):
@@ -15,7 +17,7 @@ class ConfigHandler(FileSystemEventHandler):
 
     def setup_database(self):
         """Initialize SQLite database for job status tracking"""
-        with sqlite3.connect('job_status.db') as conn:
+        with sqlite3.connect(JOB_STATUS_DB) as conn:
             conn.execute('''
                 CREATE TABLE IF NOT EXISTS jobs (
                     job_id TEXT PRIMARY KEY,
@@ -27,6 +29,11 @@ class ConfigHandler(FileSystemEventHandler):
                     results JSON
                 )
             ''')
+            # Lets retention find finished jobs without scanning the table
+            conn.execute('''
+                CREATE INDEX IF NOT EXISTS idx_jobs_status_end_time
+                ON jobs (status, end_time)
+            ''')
 
     def on_created(self, event):
         if not event.is_directory and event.src_path.endswith('.pkl'):
@@ -43,7 +50,7 @@ class ConfigHandler(FileSystemEventHandler):
             job_id = f"job_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
 
             # Initialize job status in database
-            with sqlite3.connect('job_status.db') as conn:
+            with sqlite3.connect(JOB_STATUS_DB) as conn:
                 conn.execute('''
                     INSERT INTO jobs (job_id, config_file, status, start_time)
                     VALUES (?, ?, ?, ?)
@@ -79,7 +86,7 @@ class ConfigHandler(FileSystemEventHandler):
 
     def update_job_status(self, job_id, status, error=None, results=None):
         """Update job status in database"""
-        with sqlite3.connect('job_status.db') as conn:
+        with sqlite3.connect(JOB_STATUS_DB) as conn:
             if status in ['COMPLETED', 'FAILED']:
                 conn.execute('''
                     UPDATE jobs 
@@ -112,8 +119,16 @@ def main():
     observer.schedule(event_handler, watch_dir, recursive=False)
     observer.start()
 
+    # Keep job_status.db small: archive old finished jobs and vacuum on a schedule
+    last_maintenance = 0
     try:
         while True:
+            if time.time() - last_maintenance >= JOB_MAINTENANCE_INTERVAL:
+                try:
+                    run_maintenance()
+                except Exception as e:
+                    logging.error(f"Error running job_status.db maintenance: {str(e)}")
+                last_maintenance = time.time()
             time.sleep(1)
     except KeyboardInterrupt:
         observer.stop()
@@ -1,11 +1,20 @@
 import sqlite3
 from datetime import datetime
 import json
+from job_archive import find_job
+from constants import JOB_STATUS_DB
 
 
-def check_job_status(job_id):
-    """Check status of a specific job"""
-    with sqlite3.connect('job_status.db') as conn:
+def check_job_status(job_id, include_history=False):
+    """Check status of a specific job
+
+    Polling only touches the live table; pass include_history to also search archived jobs.
+    """
+    if include_history:
+        job = find_job(job_id)
+        return {key: job[key] for key in ('status', 'start_time', 'end_time', 'results')} if job else None
+
+    with sqlite3.connect(JOB_STATUS_DB) as conn:
         cursor = conn.cursor()
         cursor.execute('''
             SELECT status, start_time, end_time, results